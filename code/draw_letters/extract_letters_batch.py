@@ -11,223 +11,451 @@ Usage:
       --step 7 --gap 20 --png-h 256 --stroke 3
 
 Deps (install once):
-  pip install svgpathtools lxml pillow
+  pip install svgpathtools lxml pillow numpy
+  # optional: pillow-simd is a drop-in replacement with SSE4/AVX2 draw paths
+  #   pip uninstall pillow && pip install pillow-simd
 """
 
 from __future__ import annotations
 import argparse
+import copy
+import functools
 import math
 import os
 import re
+from concurrent.futures import ProcessPoolExecutor
 from typing import List, Tuple, Dict
 
+import numpy as np
 from lxml import etree
-from svgpathtools import parse_path
+from svgpathtools import parse_path, Line
 
 # ----------------------------- Affine utils -----------------------------
 
-def mat(a: float, b: float, c: float, d: float, e: float, f: float) -> List[List[float]]:
+def mat(a: float, b: float, c: float, d: float, e: float, f: float) -> np.ndarray:
     # SVG matrix(a b c d e f) maps (x,y) -> (ax + cy + e, bx + dy + f)
-    return [[a, c, e],
-            [b, d, f],
-            [0, 0, 1]]
-
-def I() -> List[List[float]]:
-    return [[1,0,0],[0,1,0],[0,0,1]]
-
-def mul(A: List[List[float]], B: List[List[float]]) -> List[List[float]]:
-    return [[sum(A[i][k]*B[k][j] for k in range(3)) for j in range(3)] for i in range(3)]
-
-def apply(M: List[List[float]], x: float, y: float) -> Tuple[float, float]:
-    return (M[0][0]*x + M[0][1]*y + M[0][2],
-            M[1][0]*x + M[1][1]*y + M[1][2])
+    return np.array([[a, c, e],
+                     [b, d, f],
+                     [0, 0, 1]], dtype=np.float64)
+
+def I() -> np.ndarray:
+    return np.eye(3)
+
+_EYE2 = np.eye(2)
+
+def matrix_attr(M: np.ndarray) -> str:
+    """Format a 3x3 affine as an SVG 'matrix(a,b,c,d,e,f)' transform (round-trips exactly)."""
+    return "matrix(%r,%r,%r,%r,%r,%r)" % (float(M[0, 0]), float(M[1, 0]), float(M[0, 1]),
+                                         float(M[1, 1]), float(M[0, 2]), float(M[1, 2]))
+
+def apply_points(M: np.ndarray, pts: np.ndarray) -> np.ndarray:
+    """Apply a 3x3 affine to an (N,2) point array in one shot (skipping work for identity/translation)."""
+    if np.array_equal(M[:2, :2], _EYE2):
+        if not M[:2, 2].any():
+            return pts
+        return pts + M[:2, 2].astype(pts.dtype)
+    M = M.astype(pts.dtype)  # keep float32 point arrays float32
+    return pts @ M[:2, :2].T + M[:2, 2]
+
+@functools.lru_cache(maxsize=64)
+def _rot_mat(angle_deg: float) -> np.ndarray:
+    """rotate(angle) about the origin as a 3x3 matrix (cached per angle; read-only)."""
+    r = math.radians(angle_deg)
+    c, s = math.cos(r), math.sin(r)
+    M = np.eye(3); M[0, 0] = c; M[0, 1] = -s; M[1, 0] = s; M[1, 1] = c
+    M.setflags(write=False)
+    return M
+
+@functools.lru_cache(maxsize=64)
+def _skew_x_mat(angle_deg: float) -> np.ndarray:
+    """skewX(angle) as a 3x3 matrix (cached per angle; read-only)."""
+    M = np.eye(3); M[0, 1] = math.tan(math.radians(angle_deg))
+    M.setflags(write=False)
+    return M
+
+@functools.lru_cache(maxsize=64)
+def _skew_y_mat(angle_deg: float) -> np.ndarray:
+    """skewY(angle) as a 3x3 matrix (cached per angle; read-only)."""
+    M = np.eye(3); M[1, 0] = math.tan(math.radians(angle_deg))
+    M.setflags(write=False)
+    return M
 
 _txn_re = re.compile(r'(matrix|translate|scale|rotate|skewX|skewY)\s*\(([^)]*)\)')
 
-def _parse_transform_attr(t: str | None) -> List[List[float]]:
-    """Parse an SVG 'transform' attribute into a 3x3 matrix."""
-    if not t:
-        return I()
+@functools.lru_cache(maxsize=256)
+def _parse_transform_attr(t: str | None) -> np.ndarray:
+    """Parse an SVG 'transform' attribute into a 3x3 matrix (cached per string; read-only)."""
     T = I()
-    for name, args in _txn_re.findall(t):
+    for name, args in _txn_re.findall(t or ""):
         vals = [float(v) for v in re.split(r'[ ,]+', args.strip()) if v]
         if name == "matrix" and len(vals) == 6:
-            M = mat(*vals)
+            T = T @ mat(*vals)
         elif name == "translate":
+            # T @ translate(tx,ty) only moves the offset column
             tx = vals[0]; ty = vals[1] if len(vals) > 1 else 0.0
-            M = mat(1,0,0,1, tx,ty)
+            T[:2, 2] += T[:2, :2] @ np.array([tx, ty])
         elif name == "scale":
+            # T @ scale(sx,sy) only rescales the first two columns
             sx = vals[0]; sy = vals[1] if len(vals) > 1 else sx
-            M = mat(sx,0,0,sy, 0,0)
+            T[:2, 0] *= sx; T[:2, 1] *= sy
         elif name == "rotate":
             # rotate(angle) about origin only (rotate(a cx cy) not handled here)
-            r = math.radians(vals[0])
-            c, s = math.cos(r), math.sin(r)
-            M = mat(c, s, -s, c, 0, 0)
+            T = T @ _rot_mat(vals[0])
         elif name == "skewX":
-            k = math.tan(math.radians(vals[0])); M = [[1,k,0],[0,1,0],[0,0,1]]
+            T = T @ _skew_x_mat(vals[0])
         elif name == "skewY":
-            k = math.tan(math.radians(vals[0])); M = [[1,0,0],[k,1,0],[0,0,1]]
-        else:
-            M = I()
-        T = mul(T, M)
+            T = T @ _skew_y_mat(vals[0])
+        # anything else (e.g. malformed matrix()) is treated as identity
+    T.setflags(write=False)
     return T
 
-def world_transform(node: etree._Element) -> List[List[float]]:
-    """Accumulate transforms from node up to root (closest first applied)."""
-    chain: List[List[List[float]]] = []
-    cur = node
-    while cur is not None and isinstance(cur.tag, str):
-        chain.append(_parse_transform_attr(cur.get("transform")))
-        cur = cur.getparent()
-    T = I()
-    for M in reversed(chain):
-        T = mul(T, M)
+def world_transform(node: etree._Element, cache: Dict[etree._Element, np.ndarray]) -> np.ndarray:
+    """
+    Accumulate transforms from root down to node (closest first applied).
+    Results are memoized per element in `cache`, so sibling paths reuse
+    their shared ancestor chain instead of re-multiplying it.
+    """
+    T = cache.get(node)
+    if T is not None:
+        return T
+    parent = node.getparent()
+    Tp = I() if parent is None else world_transform(parent, cache)
+    T = Tp @ _parse_transform_attr(node.get("transform"))
+    cache[node] = T
     return T
 
 # ---------------------- Sampling & polyline processing -------------------
 
-def sample_path_uniform(path, step: float) -> List[Tuple[float,float]]:
-    """Sample an svgpathtools Path at ~uniform arc-length spacing."""
-    L = path.length()
-    if L <= 0:
-        return []
-    n = max(1, int(math.ceil(L / step)))
-    pts: List[Tuple[float,float]] = []
-    for i in range(n + 1):
-        s = min(i * step, L)
+# 16-point Gauss-Legendre rule on [-1, 1] for arc-length integrals of segments
+_GL_X, _GL_W = np.polynomial.legendre.leggauss(16)
+_ARCLEN_TOL = 1e-10       # accepted quadrature error per arc-length table interval
+_ARCLEN_MAX_DEPTH = 30
+_ILENGTH_TOL = 1e-9       # accepted |S(t) - s| when inverting arc length
+_ILENGTH_MAXITS = 60
+
+def _gl_arclen(seg, a: np.ndarray, b: np.ndarray) -> np.ndarray:
+    """Gauss-Legendre arc length of `seg` over each interval [a, b] (uses the array-aware derivative())."""
+    half = 0.5 * (b - a)
+    u = (0.5 * (a + b))[:, None] + half[:, None] * _GL_X
+    return half * (np.abs(seg.derivative(u)) @ _GL_W)
+
+def _arclen_table(seg) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Adaptive composite arc-length table of a segment -> (knots t_k, cumulative S(t_k)).
+    An interval is halved until its one-rule and two-half-rule estimates agree
+    to _ARCLEN_TOL, so kinks in |B'(t)| (cusps) get refined locally.
+    """
+    a = np.linspace(0.0, 1.0, 17)[:-1]
+    b = a + 1.0 / 16
+    starts: List[np.ndarray] = []
+    lengths: List[np.ndarray] = []
+    for depth in range(_ARCLEN_MAX_DEPTH):
+        m = 0.5 * (a + b)
+        left, right = _gl_arclen(seg, a, m), _gl_arclen(seg, m, b)
+        ok = np.abs(_gl_arclen(seg, a, b) - (left + right)) <= _ARCLEN_TOL
+        if depth == _ARCLEN_MAX_DEPTH - 1:
+            ok[:] = True
+        starts += [a[ok], m[ok]]
+        lengths += [left[ok], right[ok]]
+        a, b = np.concatenate([a[~ok], m[~ok]]), np.concatenate([m[~ok], b[~ok]])
+        if a.size == 0:
+            break
+    t_k = np.concatenate(starts)
+    order = np.argsort(t_k)
+    knots = np.append(t_k[order], 1.0)
+    cum = np.concatenate([[0.0], np.cumsum(np.concatenate(lengths)[order])])
+    return knots, cum
+
+def _invert_arclength(seg, s: np.ndarray, seg_len: float) -> np.ndarray:
+    """
+    Invert arc length for all targets `s` of one segment at once -> t array.
+    Each target is bracketed in the segment's adaptive arc-length table, then
+    refined by Newton steps that fall back to bisection whenever they leave the
+    bracket, until |S(t) - s| < _ILENGTH_TOL. Entries that still haven't
+    converged are handed to svgpathtools' own seg.ilength().
+    """
+    if seg_len <= 0 or s.size == 0:
+        return np.zeros_like(s)
+    knots, cum = _arclen_table(seg)
+    s = np.minimum(s, cum[-1])
+    k = np.clip(np.searchsorted(cum, s, side="right") - 1, 0, len(knots) - 2)
+    t0, base = knots[k], cum[k]
+    lo, hi = t0.copy(), knots[k + 1].copy()
+    span = cum[k + 1] - base
+    frac = np.divide(s - base, span, out=np.zeros_like(s), where=span > 0)
+    t = lo + (hi - lo) * frac
+
+    conv = np.zeros(s.shape, dtype=bool)
+    for _ in range(_ILENGTH_MAXITS):
+        r = base + _gl_arclen(seg, t0, t) - s
+        conv = np.abs(r) < _ILENGTH_TOL
+        if conv.all():
+            break
+        lo = np.where(r < 0, t, lo)
+        hi = np.where(r > 0, t, hi)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            t_new = t - r / np.abs(seg.derivative(t))
+        bisect = ~np.isfinite(t_new) | (t_new <= lo) | (t_new >= hi)
+        t_new = np.where(bisect, 0.5 * (lo + hi), t_new)
+        t = np.where(conv, t, t_new)
+
+    for j in np.flatnonzero(~conv):
         try:
-            t = path.ilength(s)
+            t[j] = seg.ilength(float(s[j]))
         except Exception:
-            t = i / n  # fallback
-        z = path.point(t)
-        pts.append((z.real, z.imag))
-    return pts
-
-def split_on_gaps(points: List[Tuple[float,float]], gap: float) -> List[List[Tuple[float,float]]]:
-    """Split a point list into polylines whenever distance between consecutive points > gap."""
-    if not points:
+            pass  # keep the bracketed estimate
+    return t
+
+@functools.lru_cache(maxsize=1024)
+def _parse_path_cached(d: str):
+    """Parse a path 'd' string once -> (Path, per-segment arc lengths); both are shared, don't mutate."""
+    path = parse_path(d)
+    seg_lengths = np.array([seg.length() for seg in path], dtype=np.float64)
+    seg_lengths.setflags(write=False)
+    return path, seg_lengths
+
+def sample_path_uniform(path, step: float, seg_lengths: np.ndarray | None = None) -> np.ndarray:
+    """
+    Sample an svgpathtools Path at ~uniform arc-length spacing -> (N,2) array.
+    Target arc lengths are bucketed per segment; lines are inverted in closed
+    form, every other segment type (Beziers, arcs) for all its targets at once
+    by _invert_arclength.
+    Pass precomputed `seg_lengths` to skip re-measuring the segments.
+    Sampling runs in float64; the result is stored as float32, which is
+    plenty for the 0.01-unit header output and halves downstream traffic.
+    """
+    if seg_lengths is None:
+        seg_lengths = np.array([seg.length() for seg in path], dtype=np.float64)
+    if seg_lengths.size == 0:
+        return np.empty((0, 2), dtype=np.float32)
+    cum = np.cumsum(seg_lengths)
+    L = float(cum[-1])
+    if L <= 0:
+        return np.empty((0, 2), dtype=np.float32)
+    n = max(1, int(math.ceil(L / step)))
+    s = np.linspace(0.0, L, n + 1)
+
+    # segment index per target; the last one also absorbs float round-off past cum[-1]
+    idx = np.minimum(np.searchsorted(cum, s), len(seg_lengths) - 1)
+    starts = cum - seg_lengths
+
+    out = np.empty((n + 1, 2), dtype=np.float64)
+    for k in np.unique(idx):
+        sel = idx == k
+        seg, seg_len = path[k], seg_lengths[k]
+        s_local = np.clip(s[sel] - starts[k], 0.0, seg_len)
+        if isinstance(seg, Line):
+            t = s_local / seg_len if seg_len > 0 else np.zeros_like(s_local)
+        else:
+            t = _invert_arclength(seg, s_local, seg_len)
+        z = np.asarray(seg.point(t), dtype=np.complex128)
+        out[sel] = np.column_stack([z.real, z.imag])
+    return out.astype(np.float32)
+
+def split_on_gaps(points: np.ndarray, gap: float) -> List[np.ndarray]:
+    """Split an (N,2) point array into polylines whenever distance between consecutive points > gap."""
+    if len(points) == 0:
         return []
-    out: List[List[Tuple[float,float]]] = [[points[0]]]
-    px, py = points[0]
-    for x, y in points[1:]:
-        if math.hypot(x - px, y - py) > gap:
-            out.append([])
-        out[-1].append((x, y))
-        px, py = x, y
-    return [poly for poly in out if len(poly) > 1]
+    d = np.diff(points, axis=0)
+    dist2 = (d * d).sum(axis=1)  # compare squared distances, no sqrt needed
+    breaks = np.flatnonzero(dist2 > gap * gap) + 1
+    return [poly for poly in np.split(points, breaks, axis=0) if len(poly) > 1]
+
+def simplify_rdp(points: np.ndarray, tol: float) -> np.ndarray:
+    """Ramer-Douglas-Peucker: drop points closer than tol to the chord of their span (endpoints kept)."""
+    n = len(points)
+    if n < 3 or tol <= 0:
+        return points
+    keep = np.zeros(n, dtype=bool)
+    keep[0] = keep[-1] = True
+    stack = [(0, n - 1)]
+    while stack:
+        i, j = stack.pop()
+        if j - i < 2:
+            continue
+        a, b = points[i], points[j]
+        mid = points[i + 1:j]
+        dx, dy = b[0] - a[0], b[1] - a[1]
+        norm = math.hypot(dx, dy)
+        if norm > 0:
+            dist = np.abs(dx * (a[1] - mid[:, 1]) - dy * (a[0] - mid[:, 0])) / norm
+        else:  # closed span: fall back to distance from the shared endpoint
+            dist = np.hypot(mid[:, 0] - a[0], mid[:, 1] - a[1])
+        k = int(np.argmax(dist))
+        if dist[k] > tol:
+            m = i + 1 + k
+            keep[m] = True
+            stack.append((i, m))
+            stack.append((m, j))
+    return points[keep]
 
 # ------------------------------- Rendering -------------------------------
 
-def save_png(polylines: List[List[Tuple[float,float]]], png_path: str, img_h: int = 256, stroke: int = 3) -> None:
-    """Render polylines to a PNG preview (keeps aspect ratio, Y-up -> screen Y-down)."""
+_canvas = None  # (Image, ImageDraw) reused by save_png across letters in this process
+
+def _get_canvas(W: int, H: int):
+    """Return a shared white canvas of at least W x H (grown on demand) and its ImageDraw."""
+    global _canvas
     from PIL import Image, ImageDraw
+    if _canvas is None or _canvas[0].width < W or _canvas[0].height < H:
+        size = (W, H) if _canvas is None else (max(W, _canvas[0].width), max(H, _canvas[0].height))
+        im = Image.new("RGB", size, (255, 255, 255))
+        _canvas = (im, ImageDraw.Draw(im))
+    else:
+        _canvas[1].rectangle([0, 0, W - 1, H - 1], fill=(255, 255, 255))
+    return _canvas
+
+def save_png(polylines: List[np.ndarray], png_path: str, img_h: int = 256, stroke: int = 3) -> None:
+    """Render polylines to a PNG preview (keeps aspect ratio, Y-up -> screen Y-down)."""
+    from PIL import Image  # same API under pillow-simd (faster on SSE4/AVX2 hosts)
     if not polylines:
         Image.new("RGB", (256, 256), (255, 255, 255)).save(png_path)
         return
 
-    pts = [p for poly in polylines for p in poly]
-    xs = [x for x, _ in pts]; ys = [y for _, y in pts]
-    minx, maxx = min(xs), max(xs); miny, maxy = min(ys), max(ys)
+    pts = np.concatenate(polylines)
+    minx, miny = pts.min(axis=0); maxx, maxy = pts.max(axis=0)
     w = max(1e-6, maxx - minx); h = max(1e-6, maxy - miny)
     img_w = max(1, int(round((w / h) * img_h)))
 
     pad = 12
     W, H = img_w + 2 * pad, img_h + 2 * pad
-    im = Image.new("RGB", (W, H), (255, 255, 255))
-    dr = ImageDraw.Draw(im)
+    im, dr = _get_canvas(W, H)
 
     s = min((img_w - 1) / w, (img_h - 1) / h)
     ox = pad + (img_w - s * w) * 0.5
     oy = pad + (img_h - s * h) * 0.5
 
-    def map_pt(p: Tuple[float,float]) -> Tuple[float,float]:
-        # Y-up (data) -> Y-down (image)
-        X = ox + (p[0] - minx) * s
-        Y = pad + img_h - (p[1] - miny) * s - (img_h - (s * h))
-        return (X, Y)
+    # round joints are only visible (and only worth their cost) on thick strokes
+    joint = "curve" if stroke > 1 else None
 
     for poly in polylines:
-        mapped = [map_pt(p) for p in poly]
-        dr.line(mapped, fill=(0, 0, 0), width=stroke, joint="curve")
+        # Y-up (data) -> Y-down (image); int coords truncate exactly like PIL does for floats
+        mapped = np.empty(poly.shape, dtype=np.int32)
+        mapped[:, 0] = ox + (poly[:, 0] - minx) * s
+        mapped[:, 1] = pad + img_h - (poly[:, 1] - miny) * s - (img_h - (s * h))
+        dr.line(mapped.ravel().tolist(), fill=(0, 0, 0), width=stroke, joint=joint)
 
-    im.save(png_path)
+    im.crop((0, 0, W, H)).save(png_path)
 
 # ------------------------------ Extraction -------------------------------
 
-def extract_letter_polylines(root: etree._Element, letter_id: str, step: float, gap: float) -> List[List[Tuple[float,float]]]:
+def load_letter_holders(svg_path: str, letter_ids: List[str]) -> Dict[str, etree._Element]:
+    """
+    Stream-parse the SVG and copy out only the elements whose id is in letter_ids
+    (first occurrence wins). Each copy is a standalone subtree with its ancestors'
+    transforms baked into its own 'transform'; everything else is freed as soon
+    as it has been parsed, and parsing stops once every letter has been found.
+    """
+    wanted = set(letter_ids)
+    holders: Dict[str, etree._Element] = {}
+    for _, elem in etree.iterparse(svg_path, events=("end",)):
+        eid = elem.get("id")
+        if eid in wanted and eid not in holders:
+            holder = copy.deepcopy(elem)
+            holder.tail = None  # text after the glyph isn't part of it (and breaks re-parsing)
+            parent = elem.getparent()
+            Tp = I() if parent is None else world_transform(parent, {})
+            if not np.array_equal(Tp, I()):
+                holder.set("transform", f"{matrix_attr(Tp)} {holder.get('transform') or ''}".strip())
+            holders[eid] = holder
+            if len(holders) == len(wanted):
+                break
+        if any(a.get("id") in wanted for a in elem.iterancestors()):
+            continue  # still inside a glyph that hasn't been copied out yet
+        elem.clear()
+        while elem.getprevious() is not None:
+            del elem.getparent()[0]
+    return holders
+
+def extract_letter_polylines(holder: etree._Element | None, step: float, gap: float,
+                             simplify: float = 0.0) -> List[np.ndarray]:
     """
-    Find an element with id=letter_id, gather descendant <path d="...">,
+    Given the element holding a glyph (see load_letter_holders), gather its <path d="...">,
     apply world transforms, sample uniformly, split on gaps, and flip Y
     within the glyph's local bbox to convert SVG Y-down to Y-up.
+    With simplify > 0, each polyline is then thinned by RDP at that tolerance.
     """
-    targets = root.xpath(f".//*[@id='{letter_id}']")
-    if not targets:
+    if holder is None:
         return []
-    holder = targets[0]
 
     # collect <path> nodes (including the holder itself if it's a path)
-    nodes = holder.xpath(".//*[local-name()='path' and @d]")
-    if not nodes and etree.QName(holder).localname == "path" and holder.get("d"):
-        nodes = [holder]
+    nodes = [e for e in holder.iter("{*}path") if e.get("d")]
     if not nodes:
         return []
 
-    polylines: List[List[Tuple[float,float]]] = []
+    # keyed by element (not id()): holding the proxy keeps lxml from recycling it
+    xf_cache: Dict[etree._Element, np.ndarray] = {}
+    polylines: List[np.ndarray] = []
     for nd in nodes:
-        T = world_transform(nd)
-        path = parse_path(nd.get("d"))
-        pts = [apply(T, x, y) for (x, y) in sample_path_uniform(path, step)]
+        T = world_transform(nd, xf_cache)
+        path, seg_lengths = _parse_path_cached(nd.get("d"))
+        pts = apply_points(T, sample_path_uniform(path, step, seg_lengths))
         polylines.extend(split_on_gaps(pts, gap))
 
     if not polylines:
         return []
 
-    # flip Y within glyph bbox (SVG Y-down -> plotter Y-up)
-    xs = [x for poly in polylines for x, _ in poly]
-    ys = [y for poly in polylines for _, y in poly]
-    miny, maxy = min(ys), max(ys)
-
-    flipped: List[List[Tuple[float,float]]] = []
-    for poly in polylines:
-        flipped.append([(x, maxy - (y - miny)) for (x, y) in poly])
+    # flip Y within glyph bbox (SVG Y-down -> plotter Y-up): y' = maxy - (y - miny),
+    # done in place on one glyph-wide array, then re-split at the saved polyline offsets
+    offsets = np.cumsum([len(poly) for poly in polylines[:-1]])
+    pts_all = np.concatenate(polylines)
+    ys = pts_all[:, 1]
+    np.subtract(ys.max() + ys.min(), ys, out=ys)
+    flipped = np.split(pts_all, offsets)
+    if simplify > 0:
+        flipped = [simplify_rdp(poly, simplify) for poly in flipped]
     return flipped
 
 # --------------------------------- I/O -----------------------------------
 
-def write_header(per_letter: Dict[str, List[List[Tuple[float,float]]]], out_path: str) -> None:
+def write_header(per_letter: Dict[str, List[np.ndarray]], out_path: str) -> None:
     """Write a single Arduino header with per-letter PROGMEM float coords, NAN separators, and *_len constants."""
     total_written = 0
     letters_present = "".join(sorted(per_letter.keys()))
 
+    parts: List[str] = [
+        "// Auto-generated from SVG\n",
+        "// Coordinates are Y-up. {NAN,NAN} separates polylines (pen up).\n\n",
+        "#pragma once\n#include <avr/pgmspace.h>\n#include <stdint.h>\n#include <math.h>\n\n",
+    ]
+    for lid in sorted(per_letter.keys()):
+        polys = per_letter[lid]
+        sym = f"letter_{lid}"
+        parts.append(f"// ----- {lid} -----\n")
+        parts.append(f"const float {sym}[][2] PROGMEM = {{\n")
+        body = "  {NAN, NAN},\n".join(
+            "".join(["  { %.2ff, %.2ff },\n" % (x, y) for x, y in poly.tolist()]) for poly in polys
+        )
+        parts.append(body)
+        parts.append("};\n")
+        count = sum(len(poly) for poly in polys)
+        seps = (len(polys) - 1) if len(polys) > 1 else 0
+        parts.append(f"const uint16_t {sym}_len = {count + seps};\n\n")
+        total_written += count + seps
+
+    parts.append(f"// Letters available (flash)\nconst char LETTERS_PRESENT[] PROGMEM = \"{letters_present}\";\n")
+
+    # one buffered write for the whole header instead of one per point
     with open(out_path, "w", encoding="utf-8") as f:
-        f.write("// Auto-generated from SVG\n")
-        f.write("// Coordinates are Y-up. {NAN,NAN} separates polylines (pen up).\n\n")
-        f.write("#pragma once\n#include <avr/pgmspace.h>\n#include <stdint.h>\n#include <math.h>\n\n")
-
-        for lid in sorted(per_letter.keys()):
-            polys = per_letter[lid]
-            sym = f"letter_{lid}"
-            f.write(f"// ----- {lid} -----\n")
-            f.write(f"const float {sym}[][2] PROGMEM = {{\n")
-            first = True
-            count = 0
-            for poly in polys:
-                if not first:
-                    f.write("  {NAN, NAN},\n")
-                first = False
-                for (x, y) in poly:
-                    f.write(f"  {{ {x:.2f}f, {y:.2f}f }},\n")
-                    count += 1
-            f.write("};\n")
-            seps = (len(polys) - 1) if len(polys) > 1 else 0
-            f.write(f"const uint16_t {sym}_len = {count + seps};\n\n")
-            total_written += count + seps
-
-        f.write(f"// Letters available (flash)\nconst char LETTERS_PRESENT[] PROGMEM = \"{letters_present}\";\n")
+        f.write("".join(parts))
 
     print(f"Wrote {out_path} with {len(per_letter)} glyphs, total points+separators = {total_written}")
 
+# ------------------------------ Batch workers ----------------------------
+
+def _process_letter(job: Tuple[str, bytes | None, float, float, float, str, int, int]) -> Tuple[str, List[np.ndarray]]:
+    """
+    Extract one glyph and render its PNG preview; returns (letter id, polylines).
+    The glyph subtree arrives serialized since lxml elements can't be pickled.
+    """
+    lid, holder_xml, step, gap, simplify, pngdir, png_h, stroke = job
+    holder = etree.fromstring(holder_xml) if holder_xml is not None else None
+    polys = extract_letter_polylines(holder, step=step, gap=gap, simplify=simplify)
+    if polys:
+        png_path = os.path.join(pngdir, f"letter_{lid}.png")
+        save_png(polys, png_path, img_h=png_h, stroke=stroke)
+    return lid, polys
+
 # --------------------------------- CLI -----------------------------------
 
 def main() -> None:
@@ -239,27 +467,34 @@ def main() -> None:
     ap.add_argument("--pngdir", default="png_out", help="Directory for per-letter PNG previews")
     ap.add_argument("--step", type=float, default=7.0, help="Sampling step along path in SVG units (default: 7)")
     ap.add_argument("--gap", type=float, default=20.0, help="Gap distance to split polylines (pen up) (default: 20)")
+    ap.add_argument("--simplify", type=float, default=0.0,
+                    help="Ramer-Douglas-Peucker tolerance in SVG units, 0 = keep every sample (default: 0)")
     ap.add_argument("--png-h", type=int, default=256, help="PNG height in pixels (default: 256)")
     ap.add_argument("--stroke", type=int, default=3, help="Preview stroke width in pixels (default: 3)")
+    ap.add_argument("--jobs", type=int, default=0, help="Worker processes, 1 = no pool (default: 0 = one per CPU; no pool on a single CPU)")
     args = ap.parse_args()
+    if args.jobs < 0:
+        ap.error("--jobs must be >= 0")
 
     if not os.path.isfile(args.svg):
         raise SystemExit(f"SVG not found: {args.svg}")
 
     os.makedirs(args.pngdir, exist_ok=True)
 
-    root = etree.parse(args.svg).getroot()
     letters = [chr(c) for c in range(ord('a'), ord('z') + 1)]
-
-    per_letter: Dict[str, List[List[Tuple[float,float]]]] = {}
-    for lid in letters:
-        polys = extract_letter_polylines(root, lid, step=args.step, gap=args.gap)
-        if not polys:
-            continue
-        per_letter[lid] = polys
-
-        png_path = os.path.join(args.pngdir, f"letter_{lid}.png")
-        save_png(polys, png_path, img_h=args.png_h, stroke=args.stroke)
+    holders = load_letter_holders(args.svg, letters)
+    jobs = [(lid, etree.tostring(holders[lid]) if lid in holders else None,
+             args.step, args.gap, args.simplify, args.pngdir, args.png_h, args.stroke) for lid in letters]
+
+    # letters are independent: fan them out across processes (a pool of one only adds overhead)
+    workers = min(args.jobs or os.cpu_count() or 1, len(jobs))
+    if workers == 1:
+        results = [_process_letter(job) for job in jobs]
+    else:
+        with ProcessPoolExecutor(max_workers=workers) as ex:
+            results = list(ex.map(_process_letter, jobs))
+
+    per_letter: Dict[str, List[np.ndarray]] = {lid: polys for lid, polys in results if polys}
 
     if not per_letter:
         raise SystemExit("No glyphs found. Ensure your SVG has ids 'a'..'z' on groups or paths.")